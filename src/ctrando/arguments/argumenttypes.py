@@ -42,10 +42,11 @@ def extract_from_namespace(
         arg_names: Iterable[str],
         namespace: argparse.Namespace
 ) -> _T:
+    namespace_dict = vars(namespace)
     opt_dict: dict[str, typing.Any] = {
-        name: getattr(namespace, name)
+        name: namespace_dict[name]
         for name in arg_names
-        if hasattr(namespace, name)
+        if name in namespace_dict
     }
 
     return return_type(**opt_dict)
@@ -209,7 +210,7 @@ def extract_dataclass_from_namespace(dataclass_type: typing.Type[_DT],
     namespace_dict = vars(namespace)
 
     for field in fields(dataclass_type):
-        if hasattr(namespace, field.name):
+        if field.name in namespace_dict:
             init_dict[field.name] = namespace_dict[field.name]
         # else:
         #     if not isinstance(field.default, field.type):
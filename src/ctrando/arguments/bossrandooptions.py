@@ -9,6 +9,24 @@ from ctrando.arguments import argumenttypes as aty
 from ctrando.bosses import bosstypes
 
 
+_T = typing.TypeVar("_T")
+
+
+def _as_tuple(values: Iterable[_T]) -> tuple[_T, ...]:
+    """Convert values to a tuple, reusing values if it already is one."""
+    if type(values) is tuple:
+        return values
+    return tuple(values)
+
+
+_parse_boss_spot = functools.partial(
+    aty.str_to_enum, enum_type=bosstypes.BossSpotID, force_enum_names=True
+)
+_parse_boss_id = functools.partial(
+    aty.str_to_enum, enum_type=bosstypes.BossID, force_enum_names=True
+)
+
+
 class BossRandoType(enum.StrEnum):
     VANILLA = "vanilla"
     SHUFFLE = "shuffle"
@@ -22,6 +40,11 @@ class MidBossRandoType(enum.StrEnum):
 
 
 class BossRandoOptions:
+    __slots__ = (
+        "boss_randomization_type", "midboss_randomization_type",
+        "boss_pool", "_vanilla_boss_spots", "_midboss_pool",
+        "_vanilla_boss_spots_set", "_midboss_pool_set"
+    )
     _default_rando_scheme: typing.ClassVar[BossRandoType] = BossRandoType.VANILLA
     _default_midboss_rando_scheme: typing.ClassVar[MidBossRandoType] = MidBossRandoType.VANILLA
     _default_vanilla_spots: typing.ClassVar[tuple[bosstypes.BossSpotID, ...]] = tuple()
@@ -91,9 +114,37 @@ class BossRandoOptions:
     ):
         self.midboss_randomization_type = midboss_randomization_type
         self.boss_randomization_type = boss_randomization_type
-        self.vanilla_boss_spots = tuple(vanilla_boss_spots)
-        self.boss_pool = tuple(boss_pool)
-        self.midboss_pool = tuple(midboss_pool)
+        self.vanilla_boss_spots = vanilla_boss_spots
+        self.boss_pool = _as_tuple(boss_pool)
+        self.midboss_pool = midboss_pool
+
+    @property
+    def vanilla_boss_spots(self) -> tuple[bosstypes.BossSpotID, ...]:
+        return self._vanilla_boss_spots
+
+    @vanilla_boss_spots.setter
+    def vanilla_boss_spots(self, val: Iterable[bosstypes.BossSpotID]):
+        self._vanilla_boss_spots = _as_tuple(val)
+        self._vanilla_boss_spots_set = frozenset(self._vanilla_boss_spots)
+
+    @property
+    def vanilla_boss_spots_set(self) -> frozenset[bosstypes.BossSpotID]:
+        """Set of vanilla_boss_spots for membership tests."""
+        return self._vanilla_boss_spots_set
+
+    @property
+    def midboss_pool(self) -> tuple[bosstypes.BossID, ...]:
+        return self._midboss_pool
+
+    @midboss_pool.setter
+    def midboss_pool(self, val: Iterable[bosstypes.BossID]):
+        self._midboss_pool = _as_tuple(val)
+        self._midboss_pool_set = frozenset(self._midboss_pool)
+
+    @property
+    def midboss_pool_set(self) -> frozenset[bosstypes.BossID]:
+        """Set of midboss_pool for membership tests."""
+        return self._midboss_pool_set
 
     @classmethod
     def get_argument_spec(cls) -> aty.ArgSpec:
@@ -117,8 +168,7 @@ class BossRandoOptions:
         group.add_argument(
             "--vanilla-boss-spots",
             nargs="*",
-            type=functools.partial(aty.str_to_enum, enum_type=bosstypes.BossSpotID,
-                                   force_enum_names=True),
+            type=_parse_boss_spot,
             help="Spots which must keep their vanilla boss (also midboss).",
             default=argparse.SUPPRESS
         )
@@ -126,8 +176,7 @@ class BossRandoOptions:
         group.add_argument(
             "--boss-pool",
             nargs="+",
-            type=functools.partial(aty.str_to_enum, enum_type=bosstypes.BossID,
-                                   force_enum_names=True),
+            type=_parse_boss_id,
             help="Bosses to include in assignment (only when --boss-rando-scheme=\"random\")",
             default=argparse.SUPPRESS
         )
@@ -135,8 +184,7 @@ class BossRandoOptions:
         group.add_argument(
             "--midboss-pool",
             nargs="+",
-            type=functools.partial(aty.str_to_enum, enum_type=bosstypes.BossID,
-                                   force_enum_names=True),
+            type=_parse_boss_id,
             help="Midbosses to include in assignment (only when --midboss-rando-scheme=\"random\")",
             default=argparse.SUPPRESS
         )
@@ -1,17 +1,16 @@
 """Options which are applied after randomization."""
 import argparse
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import enum
 
 import typing
-from functools import partial
 
 from ctrando.arguments import argumenttypes
 from ctrando.postrando.palettes import SNESPalette
 
 
 def clip(val: float, min_val: float, max_val: float) -> float:
-    return sorted([min_val, val, max_val])[1]
+    return min(max_val, max(min_val, val))
 
 
 class EndingID(enum.StrEnum):
@@ -44,6 +43,47 @@ def get_lightning2_effect_id(repl: Lightning2Replacement) -> int:
     return _effect_id_dict.get(repl, -1)
 
 
+def _palette_to_toml(palette: SNESPalette) -> str:
+    return palette.to_hex_sequence()
+
+
+def _value_to_toml(value: typing.Any) -> typing.Any:
+    # Subtypes of str are not handled well by toml.dumps, so convert.
+    if isinstance(value, str):
+        return str(value)
+    return value
+
+
+class _LazyPalette:
+    """
+    Descriptor for a palette field which only copies the default palette when
+    the field is first read.  Setting the field to None, including passing None
+    to PostRandoOptions.__init__ (the dataclass default), restores the default
+    palette.  Reading the field never returns None.
+    """
+    def __init__(self, default_palette: SNESPalette):
+        self.default_palette = default_palette
+        self.attr_name = ""
+
+    def __set_name__(self, owner, name: str):
+        self.attr_name = "_" + name
+
+    def __get__(self, obj, objtype=None) -> SNESPalette | None:
+        if obj is None:
+            # The dataclass default.  __set__ turns it into the real default.
+            return None
+
+        palette = getattr(obj, self.attr_name, None)
+        if palette is None:
+            palette = self.default_palette.copy()
+            setattr(obj, self.attr_name, palette)
+
+        return palette
+
+    def __set__(self, obj, value: SNESPalette | None):
+        setattr(obj, self.attr_name, value)
+
+
 
 @dataclass()
 class PostRandoOptions:
@@ -57,6 +97,12 @@ class PostRandoOptions:
         "ending", "remove_flashes", "use_l_select_warp", "use_msu1",
         "alt_lightning2"
     )
+    _toml_serializers: typing.ClassVar[
+        tuple[tuple[str, typing.Callable[[typing.Any], typing.Any]], ...]
+    ] = tuple(
+        (name, _palette_to_toml if name.endswith("_palette") else _value_to_toml)
+        for name in attr_names
+    )
     _default_fast_loc_movement: typing.ClassVar[bool] = False
     _default_fast_ow_movement: typing.ClassVar[bool] = False
     _default_fast_epoch_movement: typing.ClassVar[bool] = False
@@ -68,21 +114,6 @@ class PostRandoOptions:
     _default_menu_memory_cursor: typing.ClassVar[bool] = False
     _default_window_background: typing.ClassVar[int] = 1
 
-    _default_crono_palette_b: typing.ClassVar[bytes] = bytes.fromhex(
-        "6510FF7F3F4F1F363F02171CB53A4A77C639E11C0B00881C")
-    _default_marle_palette_b: typing.ClassVar[bytes] = bytes.fromhex(
-        "6514FF7F7F6BBF52FF27BF1EBF097000F05F293E4421671C")
-    _default_lucca_palette_b: typing.ClassVar[bytes] = bytes.fromhex(
-        "6510FF7F9F577F361F17922A8B151F0A532DA918FE7DA61C")
-    _default_robo_palette_b: typing.ClassVar[bytes] = bytes.fromhex(
-        "6510FF7F3E3F571AF4678D3E9021724EEB102925C718C920")
-    _default_frog_palette_b: typing.ClassVar[bytes] = bytes.fromhex(
-        "8514FF7FCF0BCA02FF1A0B721A3D93010F124915C510881C")
-    _default_ayla_palette_b: typing.ClassVar[bytes] = bytes.fromhex(
-        "6510FF7FDF4A1B26FF3B3E039329AC1C50564A39A7288618")
-    _default_magus_palette_b: typing.ClassVar[bytes] = bytes.fromhex(
-        "6510BD7F3B5B562EAD7E4D653A1EC74035199028641C8614")
-
     _default_crono_palette: typing.ClassVar[SNESPalette] = SNESPalette.from_bytes(
         bytes.fromhex("6510FF7F3F4F1F363F02171CB53A4A77C639E11C0B00881C"))
     _default_marle_palette: typing.ClassVar[SNESPalette] = SNESPalette.from_bytes(
@@ -110,20 +141,13 @@ class PostRandoOptions:
     menu_memory_cursor: bool = _default_menu_memory_cursor
     window_background: int = _default_window_background
 
-    crono_palette: SNESPalette = field(default_factory = partial(SNESPalette.from_bytes,
-                                                                 _default_crono_palette_b))
-    marle_palette: SNESPalette = field(default_factory = partial(SNESPalette.from_bytes,
-                                                                 _default_marle_palette_b))
-    lucca_palette: SNESPalette = field(default_factory = partial(SNESPalette.from_bytes,
-                                                                 _default_lucca_palette_b))
-    robo_palette: SNESPalette = field(default_factory = partial(SNESPalette.from_bytes,
-                                                                 _default_robo_palette_b))
-    frog_palette: SNESPalette = field(default_factory = partial(SNESPalette.from_bytes,
-                                                                 _default_frog_palette_b))
-    ayla_palette: SNESPalette = field(default_factory = partial(SNESPalette.from_bytes,
-                                                                 _default_ayla_palette_b))
-    magus_palette: SNESPalette = field(default_factory = partial(SNESPalette.from_bytes,
-                                                                 _default_magus_palette_b))
+    crono_palette: SNESPalette | None = _LazyPalette(_default_crono_palette)
+    marle_palette: SNESPalette | None = _LazyPalette(_default_marle_palette)
+    lucca_palette: SNESPalette | None = _LazyPalette(_default_lucca_palette)
+    robo_palette: SNESPalette | None = _LazyPalette(_default_robo_palette)
+    frog_palette: SNESPalette | None = _LazyPalette(_default_frog_palette)
+    ayla_palette: SNESPalette | None = _LazyPalette(_default_ayla_palette)
+    magus_palette: SNESPalette | None = _LazyPalette(_default_magus_palette)
 
     ending: EndingID = EndingID("the dream project")
     remove_flashes: bool = False
@@ -132,8 +156,8 @@ class PostRandoOptions:
     alt_lightning2: Lightning2Replacement = _default_lightning2_replacement
 
     def __post_init__(self):
-        self.battle_speed = sorted([1, int(self.battle_speed), 8])[1]
-        self.message_speed = sorted([1, int(self.message_speed), 8])[1]
+        self.battle_speed = min(8, max(1, int(self.battle_speed)))
+        self.message_speed = min(8, max(1, int(self.message_speed)))
 
     @classmethod
     def get_argument_spec(cls) -> argumenttypes.ArgSpec:
@@ -299,22 +323,10 @@ class PostRandoOptions:
         return ret
 
     def to_toml_dict(self) -> dict[str, typing.Any]:
-        ret_dict = {}
-
-        for name in self.attr_names:
-            if name in ("crono_palette", "marle_palette", "lucca_palette", "robo_palette",
-                        "frog_palette", "ayla_palette", "magus_palette"):
-                attr: SNESPalette = getattr(self, name)
-                ret_dict[name] =  attr.to_hex_sequence()
-            else:
-                attr = getattr(self, name)
-
-                # Subtypes of str are not handled well by toml.dumps, so convert.
-                if isinstance(attr, str):
-                    attr = str(attr)
-                ret_dict[name] = attr
-
-        return ret_dict
+        return {
+            name: serializer(getattr(self, name))
+            for name, serializer in self._toml_serializers
+        }
 
     def to_namespace(self) -> argparse.Namespace:
         name_dict = self.to_toml_dict()
@@ -23,6 +23,12 @@ class TechDamage(enum.StrEnum):
 
 class TechOptions:
     """Class for storing options for techs."""
+    __slots__ = (
+        "tech_order", "tech_damage", "tech_damage_random_factor_min",
+        "tech_damage_random_factor_max", "preserve_magic", "black_hole_min",
+        "black_hole_factor", "show_full_tech_list", "balance_tech_mps",
+        "custom_damage_mps", "normalize_techs"
+    )
     _default_mp_random_factor_min: typing.ClassVar[float] = 1.0
     _default_mp_random_factor_max: typing.ClassVar[float] = 1.0
     _default_tech_order: typing.ClassVar[TechOrder] = TechOrder.VANILLA
@@ -54,9 +60,9 @@ class TechOptions:
 
         tech_damage_random_factor_min = max(0.0, tech_damage_random_factor_min)
         tech_damage_random_factor_max = max(0.0, tech_damage_random_factor_max)
-        tech_damage_random_factor_min, tech_damage_random_factor_max = sorted(
-            [tech_damage_random_factor_min, tech_damage_random_factor_max]
-        )
+        if tech_damage_random_factor_min > tech_damage_random_factor_max:
+            tech_damage_random_factor_min, tech_damage_random_factor_max = \
+                tech_damage_random_factor_max, tech_damage_random_factor_min
 
         self.tech_damage_random_factor_min = tech_damage_random_factor_min
         self.tech_damage_random_factor_max = tech_damage_random_factor_max
@@ -16,6 +16,15 @@ ASMList: typing.TypeAlias = list[_T]
 _AM = inst.AddressingMode
 
 
+def _is_branch(data: Instruction | str) -> bool:
+    """
+    Determine whether data is a branch instruction.  Instructions subclass a
+    Protocol, which makes isinstance checks against them slow, so check the
+    mro directly.
+    """
+    return _BranchInstruction in type(data).__mro__
+
+
 @dataclass
 class SnippetRecord:
     offset: int
@@ -49,7 +58,7 @@ class ASMSnippet:
                 self._label_dict[instruction] = ind
                 prev_length = 0
             else:
-                if isinstance(instruction, _BranchInstruction):
+                if _is_branch(instruction):
                     unresolved_jump_indices.append(ind)
                 prev_length = len(instruction)
 
@@ -71,7 +80,7 @@ class ASMSnippet:
 
         for ind, record in enumerate(self.instruction_list):
             data = record.data
-            if isinstance(data, _BranchInstruction):
+            if _is_branch(data):
                 if data.label is not None:
                     label_index = self._label_dict[data.label]
                     label_offset = self.instruction_list[label_index].offset
@@ -113,7 +122,7 @@ class ASMSnippet:
                 binary_str = binary_str.ljust(13, ' ')
 
                 ret_str += binary_str
-                if isinstance(data, _BranchInstruction):
+                if _is_branch(data):
                     ret_str += str(data)
                     if data.label is None:
                         if data.argument is None:
@@ -136,6 +145,22 @@ def assemble(instruction_list: list[Instruction | str]) -> bytes:
     return snippet.to_bytes()
 
 
+def assemble_many(
+        routines: typing.Iterable[list[Instruction | str]]
+) -> tuple[bytes, list[int]]:
+    """
+    Assemble several routines back to back.  Each routine keeps its own
+    labels.  Returns the combined binary and the offset of each routine in it.
+    """
+    ret_b = bytearray()
+    offsets: list[int] = []
+    for routine in routines:
+        offsets.append(len(ret_b))
+        ret_b += ASMSnippet(routine).to_bytes()
+
+    return bytes(ret_b), offsets
+
+
 def main():
     AM = inst.AddressingMode
 
@@ -91,6 +91,14 @@ _modes_24_bit = (
     AddressingMode.LNG, AddressingMode.LNG_X
 )
 
+# Number of argument bytes for each addressing mode.
+_mode_arg_sizes: dict[AddressingMode, int] = {
+    AddressingMode.NO_ARG: 0,
+    **{mode: 1 for mode in _modes_8_bit},
+    **{mode: 2 for mode in _modes_16_bit},
+    **{mode: 3 for mode in _modes_24_bit},
+}
+
 
 class _Instruction(Protocol):
     """Protocol for Instructions"""
@@ -119,9 +127,8 @@ class _Instruction(Protocol):
 
     def to_bytearray(self) -> bytearray:
         """Convert a command to binary"""
-        ret = bytearray()
-        ret.append(self._opcode_dict[self.mode])
-        ret.extend(_get_argument_bytes(self.argument, self.mode))
+        ret = bytearray((self._opcode_dict[self.mode],))
+        ret += _get_argument_bytes(self._argument, self.mode)
         return ret
 
     def __str__(self) -> str:
@@ -191,16 +198,10 @@ class _Instruction(Protocol):
         return f'{cmd_name} {arg_str}'
 
     def __len__(self) -> int:
-        if self.mode == _AM.NO_ARG:
-            return 1
-        if self.mode in _modes_8_bit:
-            return 2
-        if self.mode in _modes_16_bit:
-            return 3
-        if self.mode in _modes_24_bit:
-            return 4
+        if self.mode not in _mode_arg_sizes:
+            raise InvalidAddressingModeException
 
-        raise InvalidAddressingModeException
+        return 1 + _mode_arg_sizes[self.mode]
 
 
 def _verify_argument(argument: Optional[int],
@@ -249,12 +250,7 @@ def _get_argument_bytes(argument: Optional[int],
     if mode in (AM.REL_16, AM.REL_8):
         is_signed = True
 
-    if mode in _modes_8_bit:
-        num_bytes = 1
-    elif mode in _modes_16_bit:
-        num_bytes = 2
-    else:
-        num_bytes = 3
+    num_bytes = _mode_arg_sizes.get(mode, 3)
 
     try:
         return argument.to_bytes(num_bytes, 'little',
@@ -13,6 +13,7 @@ class EventMod(locationevent.LocEventMod):
     taban_obj = 0xA
     temp_addr = 0x7F0230
     can_eot_addr = 0x7F0232
+    remove_obj_ids = tuple(range(0x18, 0x9, -1))
 
     @classmethod
     def modify(cls, script: locationevent.LocationEvent):
@@ -112,6 +113,5 @@ class EventMod(locationevent.LocEventMod):
         Actually remove unneeded objects: NPC Taban, NPC Lucca, crowd,
         pendant, lightning bolts,
         """
-        remove_ids = list(range(0x18, 0x9, -1))
-        for obj_id in remove_ids:
+        for obj_id in cls.remove_obj_ids:
             script.remove_object(obj_id)
@@ -118,14 +118,14 @@ def get_random_midboss_assignment(
 
     spot_pool, boss_pool = zip(
         *{spot: boss for spot, boss in base_dict.items()
-          if spot not in boss_rando_options.vanilla_boss_spots}.items()
+          if spot not in boss_rando_options.vanilla_boss_spots_set}.items()
     )
 
     spot_pool = list(spot_pool)
 
     boss_pool = list(boss_pool)
     if boss_rando_options.midboss_randomization_type == bro.MidBossRandoType.RANDOM:
-        test_pool = set(boss_rando_options.midboss_pool).intersection(boss_pool)
+        test_pool = boss_rando_options.midboss_pool_set.intersection(boss_pool)
         if test_pool:
             boss_pool = list(test_pool)
 
@@ -204,7 +204,7 @@ def get_random_boss_assignment(
 
     available_spots = [
         spot for spot in base_dict
-        if spot not in boss_rando_options.vanilla_boss_spots
+        if spot not in boss_rando_options.vanilla_boss_spots_set
         and spot not in _midboss_spots
     ]
 
@@ -264,6 +264,15 @@ class CTRom(freespace.FSRom):
         #     == self.getbuffer()[0x408000:0x410000]
         # )
 
+    def write_at(
+            self, addr: int, payload,
+            write_mark: freespace.FSWriteType = freespace.FSWriteType.NO_MARK,
+            register_name: str | None = None,
+    ):
+        """Seek to addr and write payload there (mirrored as in write)."""
+        self.seek(addr)
+        self.write(payload, write_mark, register_name)
+
     def apply_ips_patch(
             self,
             object_or_filename: pathlib.Path | str | typing.BinaryIO | io.BytesIO
@@ -8,6 +8,7 @@ the weights, then return a random element of the pair's value_list.
 
 from __future__ import annotations
 
+import bisect
 import copy
 import itertools
 from collections.abc import Iterable, Sequence
@@ -32,6 +33,9 @@ class Distribution(typing.Generic[T]):
     given is a sequence, then the behavior is to give a random item from the
     sequence.
     """
+    __slots__ = ("__total_weight", "weight_object_pairs", "_cum_weights",
+                 "_objs")
+
     def __init__(
             self,
             *weight_object_pairs: typing.Tuple[WeightType, ObjType],
@@ -51,6 +55,8 @@ class Distribution(typing.Generic[T]):
 
         self.__total_weight = 0
         self.weight_object_pairs: list[typing.Tuple[WeightType, list[T]]] = []
+        self._cum_weights: list[WeightType] = []
+        self._objs: list[list[T]] = []
 
         self.set_weight_object_pairs(list(weight_object_pairs))
 
@@ -93,15 +99,24 @@ class Distribution(typing.Generic[T]):
         choose an element of that object.
         """
         target = rng.random()*self.__total_weight
+        ind = bisect.bisect_right(self._cum_weights, target)
 
-        cum_weight = 0
-        for weight, obj in self.weight_object_pairs:
-            cum_weight += weight
+        if ind >= len(self._objs):
+            raise ValueError('No choice made.')
 
-            if cum_weight > target:
-                return rng.choice(obj)
+        return rng.choice(self._objs[ind])
 
-        raise ValueError('No choice made.')
+    def get_random_items(self,
+                         num_items: int,
+                         rng: RNGType) -> list[T]:
+        """
+        Get num_items random items from the distribution.  Equivalent to
+        calling get_random_item num_items times, but the weight-object pairs
+        are all chosen in a single call.
+        """
+        buckets = rng.choices(self._objs, cum_weights=self._cum_weights,
+                              k=num_items)
+        return [rng.choice(bucket) for bucket in buckets]
 
     def get_all_items_multiplicity(self) -> list[T]:
         ret = list()
@@ -128,12 +143,64 @@ class Distribution(typing.Generic[T]):
         Sets the Distribution to have the given (float, object_list) pairs.
         """
         cleaned_pairs = self._handle_weight_object_pairs(new_pairs)
-        self.weight_object_pairs = cleaned_pairs
-        self.__total_weight = sum(x[0] for x in cleaned_pairs)
+        self._set_pairs_unchecked(cleaned_pairs)
 
         if self.__total_weight == 0:
             raise ZeroWeightException
 
+    def _set_pairs_unchecked(
+            self,
+            pairs: list[typing.Tuple[WeightType, list[T]]]
+    ):
+        """
+        Set the (weight, object_list) pairs without cleaning them.  The caller
+        guarantees that every weight is nonzero and every list is nonempty.
+        """
+        self.weight_object_pairs = pairs
+        self._cum_weights = list(itertools.accumulate(x[0] for x in pairs))
+        self._objs = [x[1] for x in pairs]
+        self.__total_weight = self._cum_weights[-1] if pairs else 0
+
+    @classmethod
+    def _from_validated(
+            cls,
+            pairs: list[typing.Tuple[WeightType, list[T]]]
+    ) -> typing.Self:
+        """
+        Make a Distribution from pairs which are already cleaned (e.g. taken
+        from another Distribution) without revalidating them.
+        """
+        ret = cls.__new__(cls)
+        ret._set_pairs_unchecked(pairs)
+        return ret
+
+    def copy(self) -> typing.Self:
+        """Return a copy of this Distribution with its own object lists."""
+        return self._from_validated(
+            [(weight, list(objs)) for weight, objs in self.weight_object_pairs]
+        )
+
+    def __copy__(self) -> typing.Self:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> typing.Self:
+        return self._from_validated(
+            copy.deepcopy(self.weight_object_pairs, memo)
+        )
+
+    def scaled(self, factor: float) -> typing.Self:
+        """
+        Return a copy of this Distribution with every weight multiplied by
+        factor.
+        """
+        if factor <= 0:
+            raise ValueError("Scale factor must be positive.")
+
+        return self._from_validated(
+            [(weight*factor, list(objs))
+             for weight, objs in self.weight_object_pairs]
+        )
+
     def get_restricted_distribution(
             self, remove_values: Iterable[T],
             remove_weight: bool = True
@@ -1,6 +1,9 @@
 """Module for working with Weapon/Armor Effects"""
 from collections.abc import Sequence
 from io import BytesIO
+import functools
+import struct
+import typing
 
 from ctrando.asm import assemble, instructions as inst
 from ctrando.asm.instructions import AddressingMode as AM
@@ -10,14 +13,48 @@ from ctrando.common.freespace import FSWriteType
 from ctrando.attacks import pctech
 
 
+_effect_mod_struct = struct.Struct("BBB")
+
+
 class EffectMod(cty.SizedBinaryData):
     SIZE = 3
     ROM_RW = cty.AbsPointerRW(0x01EB3E) # C1EB3D  BF 05 2A CC    LDA $CC2A05,X
 
+    @classmethod
+    def make(cls, byte0: int, byte1: int = 0, byte2: int = 0) -> typing.Self:
+        """Make an EffectMod from its three bytes."""
+        return cls(_effect_mod_struct.pack(byte0, byte1, byte2))
+
+    @classmethod
+    def read_many_bytes_from_ctrom(cls, ct_rom: ctrom.CTRom,
+                                   count: int) -> bytes:
+        """Read the raw bytes of the first count EffectMods."""
+        return cls.ROM_RW.read_data_from_ctrom(ct_rom, count*cls.SIZE)
+
+    @classmethod
+    def read_many_from_ctrom(cls, ct_rom: ctrom.CTRom,
+                             count: int) -> list[typing.Self]:
+        """Read the first count EffectMods with a single read."""
+        data = cls.read_many_bytes_from_ctrom(ct_rom, count)
+        return [cls(data[ind:ind+cls.SIZE])
+                for ind in range(0, len(data), cls.SIZE)]
+
+
 _vanilla_effect_start = 0x0C2A05
 _vanilla_effect_count = 0x39
 _max_vanilla_routine_index = 0x42
 
+# Routine indices of the routines in gather_new_effect_rts (in order).
+_new_routine_base_index = _max_vanilla_routine_index + 1
+_venus_bow_routine_index = _new_routine_base_index
+_spellslinger_routine_index = _new_routine_base_index + 1
+_add_element_routine_index = _new_routine_base_index + 2
+_iron_orb_routine_index = _new_routine_base_index + 3
+_valiant_routine_index = _new_routine_base_index + 4
+_mp_crit_routine_index = _new_routine_base_index + 5
+_heal_on_hit_routine_index = _new_routine_base_index + 6
+_mp_on_hit_routine_index = _new_routine_base_index + 7
+
 _current_attacker_slot = 0xB18B
 _current_damage_offset = 0xAD89
 _current_element_offset = 0xB190
@@ -49,20 +86,23 @@ _local_haste_offset = _local_status_offset + 2
 
 def get_spellslinger_effect(effect_id: int, damage_divisor: int) -> EffectMod:
     if not 1 <= damage_divisor < 0xFF:
-        raise ValueError
-    return EffectMod(bytes([effect_id, 0, damage_divisor]))
+        raise ValueError(
+            f"Spellslinger damage divisor must be in [1, 0xFF) (got {damage_divisor})"
+        )
+    return EffectMod.make(effect_id, 0, damage_divisor)
 
 
 
 def gather_vanilla_effects(ct_rom: ctrom.CTRom) -> list[EffectMod]:
-    effects = [
-        EffectMod.read_from_ctrom(ct_rom, ind) for ind in range(_vanilla_effect_count)
-    ]
+    return EffectMod.read_many_from_ctrom(ct_rom, _vanilla_effect_count)
 
-    return effects
 
+def gather_vanilla_effects_bytes(ct_rom: ctrom.CTRom) -> bytes:
+    """Read the vanilla effect table as raw bytes."""
+    return EffectMod.read_many_bytes_from_ctrom(ct_rom, _vanilla_effect_count)
 
-def gather_new_effects_and_rts(orb_percent: int) -> tuple[list[EffectMod], list[assemble.ASMList]]:
+
+def gather_new_effect_rts() -> list[assemble.ASMList]:
     routines = [
         get_venus_bow_rt(),
         get_spellslinger_rt(),
@@ -74,30 +114,57 @@ def gather_new_effects_and_rts(orb_percent: int) -> tuple[list[EffectMod], list[
         get_mp_on_hit_rt()
     ]
 
+    return routines
+
+
+@functools.cache
+def _get_new_effect_rts_b() -> tuple[bytes, tuple[int, ...]]:
+    """
+    Assembled routines from gather_new_effect_rts and the offset of each one.
+    They do not depend on the rom, so they only need to be assembled once.
+    """
+    rts_b, offsets = assemble.assemble_many(gather_new_effect_rts())
+    return rts_b, tuple(offsets)
+
+
+def gather_new_effects(orb_percent: int) -> list[EffectMod]:
     effects = [
-        EffectMod(bytes([_max_vanilla_routine_index+1, 0, 0])),
-        get_spellslinger_effect(_max_vanilla_routine_index+2, 2),
+        EffectMod.make(_venus_bow_routine_index, 0, 0),
+        EffectMod.make(_spellslinger_routine_index, 0, 2),  # Spellslinger /2
         # Armor
-        EffectMod(bytes([0x26, 0x44, 0])),  # Shield + Barrier
-        EffectMod(bytes([0, 0, 0])),        # Weird elem aegis exception
-        EffectMod(bytes([0, 1, 0])),        # Crown
-        EffectMod(bytes([0, 2, 0])),        # Tiara
-        EffectMod(bytes([_max_vanilla_routine_index + 3, 0x80, 0])),  # Add lit
-        EffectMod(bytes([_max_vanilla_routine_index + 3, 0x40, 0])),  # Add shadow
-        EffectMod(bytes([_max_vanilla_routine_index + 3, 0x20, 0])),  # Add water
-        EffectMod(bytes([_max_vanilla_routine_index + 3, 0x10, 0])),  # Add fire
-        EffectMod(bytes([_max_vanilla_routine_index + 4, orb_percent//10, 0])),  # ORB
-        EffectMod(bytes([_max_vanilla_routine_index + 5, 0, 0])),  # Valiant
-        EffectMod(bytes([_max_vanilla_routine_index + 6, 5, 0])),  # MP crit
-        EffectMod(bytes([_max_vanilla_routine_index + 6, 20, 1])),  # MP crit4x
-        EffectMod(bytes([_max_vanilla_routine_index + 7, 5, 0])),  # HP Leach 5%
-        EffectMod(bytes([_max_vanilla_routine_index + 7, 10, 0])),  # HP Leach 10%
-        EffectMod(bytes([_max_vanilla_routine_index + 8, 2, 0])),  # MP Leach 2
-        EffectMod(bytes([_max_vanilla_routine_index + 8, 5, 0])),  # MP Leach 5
-        EffectMod(bytes([2, 1, 2])),
+        EffectMod.make(0x26, 0x44, 0),  # Shield + Barrier
+        EffectMod.make(0, 0, 0),        # Weird elem aegis exception
+        EffectMod.make(0, 1, 0),        # Crown
+        EffectMod.make(0, 2, 0),        # Tiara
+        EffectMod.make(_add_element_routine_index, 0x80, 0),  # Add lit
+        EffectMod.make(_add_element_routine_index, 0x40, 0),  # Add shadow
+        EffectMod.make(_add_element_routine_index, 0x20, 0),  # Add water
+        EffectMod.make(_add_element_routine_index, 0x10, 0),  # Add fire
+        EffectMod.make(_iron_orb_routine_index, orb_percent//10, 0),  # ORB
+        EffectMod.make(_valiant_routine_index, 0, 0),  # Valiant
+        EffectMod.make(_mp_crit_routine_index, 5, 0),  # MP crit
+        EffectMod.make(_mp_crit_routine_index, 20, 1),  # MP crit4x
+        EffectMod.make(_heal_on_hit_routine_index, 5, 0),  # HP Leach 5%
+        EffectMod.make(_heal_on_hit_routine_index, 10, 0),  # HP Leach 10%
+        EffectMod.make(_mp_on_hit_routine_index, 2, 0),  # MP Leach 2
+        EffectMod.make(_mp_on_hit_routine_index, 5, 0),  # MP Leach 5
+        EffectMod.make(2, 1, 2),
     ]
 
-    return effects, routines
+    return effects
+
+
+@functools.lru_cache(maxsize=8)
+def _get_new_effects_b(orb_percent: int) -> bytes:
+    """
+    Packed effects from gather_new_effects.  Only the iron orb effect depends
+    on orb_percent, so the bytes are cached by it.
+    """
+    return b''.join(gather_new_effects(orb_percent))
+
+
+def gather_new_effects_and_rts(orb_percent: int) -> tuple[list[EffectMod], list[assemble.ASMList]]:
+    return gather_new_effects(orb_percent), gather_new_effect_rts()
 
 
 def add_independent_sunshades_effect(ct_rom: ctrom.CTRom):
@@ -165,6 +232,100 @@ def add_independent_sunshades_effect(ct_rom: ctrom.CTRom):
 
     asmpatcher.apply_jmp_patch(rt, hook_file_addr, ct_rom, None, 0x410000)
 
+
+def _make_armor_effect_rt(
+        effect_mod_start_rom: int,
+        battle_index: int,
+        hook_rom_addr: int
+) -> assemble.ASMList:
+    """
+    Make the armor effect routine for the PC in the given battle slot.
+
+    Every absolute (AM.ABS) operand is an address in that PC's stat block and
+    every long JMP returns to an offset from hook_rom_addr.
+    _get_armor_effect_rt_template relies on this to relocate one assembled
+    copy of the routine.
+    """
+    # Entering with
+    # - 8 bit A, 16-bit X/Y
+    # - Byte0 of EffectMod in A
+    pc_stat_base = 0x5E2D + 0x80*battle_index
+    local_crown_offset = _crown_offset - 0x5E2D
+    element_offset = 0x3F
+    early_return_rom_addr = hook_rom_addr + 4
+    late_return_rom_addr = hook_rom_addr + 15
+    rt: assemble.ASMList = [
+        # LDA sets Z, so no CMP #$00 is needed before branching.
+        inst.LDA(effect_mod_start_rom, AM.LNG_X),
+        inst.BEQ("new_rt"),
+        inst.JMP(early_return_rom_addr, AM.LNG),
+        "new_rt",
+        # For now only aegis
+        inst.LDA(effect_mod_start_rom+1, AM.LNG_X),
+        inst.BNE("crown"),
+        # Zero the four element bytes as two 16-bit words.
+        inst.REP(0x20),
+        inst.STZ(pc_stat_base + element_offset, AM.ABS),
+        inst.STZ(pc_stat_base + element_offset + 2, AM.ABS),
+        inst.SEP(0x20),
+        inst.BRA("end"),
+        "crown",
+        inst.DEC(mode=AM.NO_ARG),
+        inst.BNE("tiara"),
+        inst.LDA(0x80, AM.IMM8),
+        inst.TSB(pc_stat_base+local_crown_offset, AM.ABS),
+        inst.LDA(0xFF, AM.IMM8),
+        inst.TSB(pc_stat_base+_local_status_offset, AM.ABS),
+        inst.BRA("end"),
+        "tiara",
+        inst.DEC(mode=AM.NO_ARG),
+        inst.BNE("end"),
+        inst.LDA(0x80, AM.IMM8),
+        inst.TSB(pc_stat_base + _local_haste_offset, AM.ABS),
+        inst.LDA(0xFF, AM.IMM8),
+        inst.TSB(pc_stat_base + _local_status_offset, AM.ABS),
+        "end",  # Shared by all branches
+        inst.JMP(late_return_rom_addr, AM.LNG),
+    ]
+    return rt
+
+
+def _get_armor_effect_rt_template(
+        effect_mod_start_rom: int
+) -> tuple[bytes, list[int], list[int]]:
+    """
+    Assemble the armor effect routine for battle slot 0 and a hook at 0.
+
+    Returns the routine's bytes, the offsets of its stat block operands, and
+    the offsets of its return address operands.
+    """
+    snippet = assemble.ASMSnippet(
+        _make_armor_effect_rt(effect_mod_start_rom, 0, 0)
+    )
+
+    stat_operands: list[int] = []
+    return_operands: list[int] = []
+    for record in snippet.instruction_list:
+        data = record.data
+        if isinstance(data, str):
+            continue
+        if data.mode == AM.ABS:
+            stat_operands.append(record.offset + 1)
+        elif isinstance(data, inst.JMP) and data.mode == AM.LNG:
+            return_operands.append(record.offset + 1)
+
+    return snippet.to_bytes(), stat_operands, return_operands
+
+
+def _relocate_operands(routine_b: bytearray, operand_offsets: Sequence[int],
+                       operand_size: int, delta: int):
+    """Add delta to each little-endian operand of routine_b in place."""
+    for offset in operand_offsets:
+        end = offset + operand_size
+        value = int.from_bytes(routine_b[offset:end], "little") + delta
+        routine_b[offset:end] = value.to_bytes(operand_size, "little")
+
+
 def patch_additional_armor_effects(ct_rom: ctrom.CTRom,
                                    effect_mod_start_file: int ):
     """
@@ -201,56 +362,8 @@ def patch_additional_armor_effects(ct_rom: ctrom.CTRom,
     # FDB5B1  1F 70 3B 41    ORA $413B70,X      # Or that byte of stat memory with byte 1
     # FDB5B5  99 2D 5E       STA $5E2D,Y        # Store back
     # --- Late return + 0x0F bytes
-    return_rom_addr = 0xFDB5B8
-    return_file_addr = byteops.to_file_ptr(return_rom_addr)
     # FDB5B8  AD F7 5E       LDA $5EF7
 
-    def make_effect_rt(battle_index: int, hook_rom_addr: int):
-        # Entering with
-        # - 8 bit A, 16-bit X/Y
-        # - Byte0 of EffectMod in A
-        pc_stat_base = 0x5E2D + 0x80*battle_index
-        local_crown_offset = _crown_offset - 0x5E2D
-        element_offset = 0x3F
-        early_return_rom_addr = hook_rom_addr + 4
-        late_return_rom_addr = hook_rom_addr + 15
-        rt: assemble.ASMList = [
-            inst.LDA(effect_mod_start_rom, AM.LNG_X),
-            inst.CMP(0x00, AM.IMM8),
-            inst.BEQ("new_rt"),
-            inst.JMP(early_return_rom_addr, AM.LNG),
-            "new_rt",
-            # For now only aegis
-            inst.LDA(effect_mod_start_rom+1, AM.LNG_X),
-            inst.CMP(0x00, AM.IMM8),
-            inst.BNE("crown"),
-            inst.LDA(0x00, AM.IMM8),
-            inst.STA(pc_stat_base + element_offset, AM.ABS),
-            inst.STA(pc_stat_base + element_offset + 1, AM.ABS),
-            inst.STA(pc_stat_base + element_offset + 2, AM.ABS),
-            inst.STA(pc_stat_base + element_offset + 3, AM.ABS),
-            inst.JMP(late_return_rom_addr, AM.LNG),
-            "crown",
-            inst.DEC(mode=AM.NO_ARG),
-            inst.BNE("tiara"),
-            inst.LDA(0x80, AM.IMM8),
-            inst.TSB(pc_stat_base+local_crown_offset, AM.ABS),
-            inst.LDA(0xFF, AM.IMM8),
-            inst.TSB(pc_stat_base+_local_status_offset, AM.ABS),
-            inst.JMP(late_return_rom_addr, AM.LNG),
-            "tiara",
-            inst.DEC(mode=AM.NO_ARG),
-            inst.BNE("end"),
-            inst.LDA(0x80, AM.IMM8),
-            inst.TSB(pc_stat_base + _local_haste_offset, AM.ABS),
-            inst.LDA(0xFF, AM.IMM8),
-            inst.TSB(pc_stat_base + _local_status_offset, AM.ABS),
-            "end",
-            inst.JMP(late_return_rom_addr, AM.LNG),
-
-        ]
-        return rt
-
     # FDB5A9  BF 6F 3B 41    LDA $413B6F,X  # PC0, armor
     # FDB5C8  BF 6F 3B 41    LDA $413B6F,X  # PC1, armor
     # FDB5E7  BF 6F 3B 41    LDA $413B6F,X  # PC2, armor
@@ -266,10 +379,105 @@ def patch_additional_armor_effects(ct_rom: ctrom.CTRom,
         (0xFDB645, 2),
     ]
 
+    template_b, stat_operands, return_operands = \
+        _get_armor_effect_rt_template(effect_mod_start_rom)
+
+    # All copies have the same size, so allocate and write them as one block.
+    rt_size = len(template_b)
+    rts_addr = ct_rom.space_manager.get_free_addr(rt_size*len(hook_pc_pairs))
+    rts_b = bytearray()
+
     for rom_hook, pc_id in hook_pc_pairs:
-        file_hook = byteops.to_file_ptr(rom_hook)
-        rt = make_effect_rt(pc_id, rom_hook)
-        asmpatcher.apply_jmp_patch(rt, file_hook, ct_rom)
+        rt_b = bytearray(template_b)
+        _relocate_operands(rt_b, stat_operands, 2, 0x80*pc_id)
+        _relocate_operands(rt_b, return_operands, 3, rom_hook)
+
+        rt_rom_addr = byteops.to_rom_ptr(rts_addr + len(rts_b))
+        rts_b += rt_b
+
+        ct_rom.write_at(byteops.to_file_ptr(rom_hook),
+                        inst.JMP(rt_rom_addr, AM.LNG).to_bytearray())
+
+    ct_rom.write_at(rts_addr, rts_b, FSWriteType.MARK_USED)
+
+
+def _make_bank_switch_rt(ptr_table_rom_st: int) -> assemble.ASMList:
+    # Enter with 8-bit A, 16-bit X/Y
+    effect_switch_rt: assemble.ASMList = [
+        # Replace hook bytes
+        inst.STA(0x20, AM.DIR),
+        inst.CMP(_new_routine_base_index, AM.IMM8),
+        inst.BCS("new_bank"),
+        inst.ASL(mode=AM.NO_ARG),
+        inst.TAX(),
+        inst.JMP(0xC1EB45, AM.LNG),  # Back to vanilla JSR
+        "new_bank",
+        inst.SEC(),
+        inst.SBC(_new_routine_base_index, AM.IMM8),
+        inst.ASL(mode=AM.NO_ARG),
+        inst.TAX(),
+        inst.JSR(ptr_table_rom_st & 0xFFFF, AM.ABS_X_16),
+        inst.JMP(0xC1EB48, AM.LNG)  # To vanilla RTS
+    ]
+    return effect_switch_rt
+
+
+# The routine's size does not depend on the pointer table's location.
+_bank_switch_rt_size = len(assemble.assemble(_make_bank_switch_rt(0)))
+
+
+# File addresses of pointers to the effect table, each with the offset (into
+# an EffectMod) which the pointer should point to.
+_effect_ptr_offsets: dict[int, int] = {
+    # Weapon effects
+    0x01EB2E: 1, 0x01EB36: 2, 0x01EB3E: 0,
+    # Armor effects --
+    # FDB5A9  BF 05 2A CC    LDA $CC2A05,X  # PC1
+    # FDB5B1  1F 06 2A CC    ORA $CC2A06,X
+    # 0x3DB5AA: 0,
+    0x3DB5B2: 1,
+    # FDB5C8  BF 05 2A CC    LDA $CC2A05,X  # PC2
+    # FDB5D0  1F 06 2A CC    ORA $CC2A06,X
+    # 0x3DB5C9: 0,
+    0x3DB5D1: 1,
+    # FDB5E7  BF 05 2A CC    LDA $CC2A05,X  # PC3
+    # FDB5EF  1F 06 2A CC    ORA $CC2A06,X
+    # 0x3DB5E8: 0,
+    0x3DB5F0: 1,
+    # Helm Effects --
+    # FDB607  BF 05 2A CC    LDA $CC2A05,X  # PC1
+    # FDB60F  1F 06 2A CC    ORA $CC2A06,X
+    # 0x3DB608: 0,
+    0x3DB610: 1,
+    # FDB626  BF 05 2A CC    LDA $CC2A05,X  # PC2
+    # FDB62E  1F 06 2A CC    ORA $CC2A06,X
+    # 0x3DB627: 0,
+    0x3DB62F: 1,
+    # FDB645  BF 05 2A CC    LDA $CC2A05,X
+    # FDB64D  1F 06 2A CC    ORA $CC2A06,X
+    # 0x3DB646: 0,
+    0x3DB64E: 1,
+}
+
+
+def _group_ptr_runs(
+        addr_offset_dict: dict[int, int]
+) -> list[tuple[int, tuple[int, ...]]]:
+    """
+    Group 3-byte pointer addresses which are next to each other into runs so
+    that each run can be written at once.  Returns (start, offsets) pairs.
+    """
+    runs: list[tuple[int, list[int]]] = []
+    for addr, offset in sorted(addr_offset_dict.items()):
+        if runs and runs[-1][0] + 3*len(runs[-1][1]) == addr:
+            runs[-1][1].append(offset)
+        else:
+            runs.append((addr, [offset]))
+
+    return [(addr, tuple(offsets)) for addr, offsets in runs]
+
+
+_effect_ptr_runs = _group_ptr_runs(_effect_ptr_offsets)
 
 
 def expand_effect_mods(
@@ -286,7 +494,6 @@ def expand_effect_mods(
     pointer table (different bank) is used for the new effects.
     """
 
-    effects = gather_vanilla_effects(ct_rom)
     orb_mp = 8
     for tech_id in range(1+6*8, 1+7*8):
         tech = tech_man.get_tech(tech_id)
@@ -294,56 +501,23 @@ def expand_effect_mods(
             orb_mp = tech.effect_mps[0]
             break
     orb_percent = pctech.get_iron_orb_percent(orb_mp)
-    additional_effects, additional_effect_routines = gather_new_effects_and_rts(orb_percent)
-
-    effects += additional_effects
+    payload = gather_vanilla_effects_bytes(ct_rom) + \
+        _get_new_effects_b(orb_percent)
 
     # Write out new effects.
-    new_size = len(effects)*EffectMod.SIZE
     new_eff_start = ct_rom.space_manager.get_free_addr(
-        new_size, 0x410000
+        len(payload), 0x410000
     )
 
-    payload = b''.join(x for x in effects)
-    ct_rom.seek(new_eff_start)
-    ct_rom.write(payload, FSWriteType.MARK_USED)
-
-    addr_offset_dict: dict[int, int] = {
-        # Weapon effects
-        0x01EB2E: 1, 0x01EB36: 2, 0x01EB3E: 0,
-        # Armor effects --
-        # FDB5A9  BF 05 2A CC    LDA $CC2A05,X  # PC1
-        # FDB5B1  1F 06 2A CC    ORA $CC2A06,X
-        # 0x3DB5AA: 0,
-        0x3DB5B2: 1,
-        # FDB5C8  BF 05 2A CC    LDA $CC2A05,X  # PC2
-        # FDB5D0  1F 06 2A CC    ORA $CC2A06,X
-        # 0x3DB5C9: 0,
-        0x3DB5D1: 1,
-        # FDB5E7  BF 05 2A CC    LDA $CC2A05,X  # PC3
-        # FDB5EF  1F 06 2A CC    ORA $CC2A06,X
-        # 0x3DB5E8: 0,
-        0x3DB5F0: 1,
-        # Helm Effects --
-        # FDB607  BF 05 2A CC    LDA $CC2A05,X  # PC1
-        # FDB60F  1F 06 2A CC    ORA $CC2A06,X
-        # 0x3DB608: 0,
-        0x3DB610: 1,
-        # FDB626  BF 05 2A CC    LDA $CC2A05,X  # PC2
-        # FDB62E  1F 06 2A CC    ORA $CC2A06,X
-        # 0x3DB627: 0,
-        0x3DB62F: 1,
-        # FDB645  BF 05 2A CC    LDA $CC2A05,X
-        # FDB64D  1F 06 2A CC    ORA $CC2A06,X
-        # 0x3DB646: 0,
-        0x3DB64E: 1,
-    }
+    ct_rom.write_at(new_eff_start, payload, FSWriteType.MARK_USED)
 
     rom_addr = byteops.to_rom_ptr(new_eff_start)
-    for addr, offset in addr_offset_dict.items():
-        ct_rom.seek(addr)
-        ct_rom.write(int.to_bytes(rom_addr+offset, 3, "little"))
-
+    for addr, offsets in _effect_ptr_runs:
+        ct_rom.write_at(
+            addr,
+            b''.join(int.to_bytes(rom_addr+offset, 3, "little")
+                     for offset in offsets)
+        )
 
     # C1EB3D  BF 05 2A CC    LDA $CC2A05,X
     # ----- Replace these four bytes
@@ -356,71 +530,33 @@ def expand_effect_mods(
     hook_addr = 0x01EB41
 
     # 2) Collect the new effect routines
-    effect_rts: list[bytes] = [
-        assemble.assemble(routine) for routine in additional_effect_routines
-    ]
+    rt_b, rt_offsets = _get_new_effect_rts_b()
 
     # 3) Allocate space for new routines
-    effect_rt_lens: list[int] = [len(routine_b) for routine_b in effect_rts]
-
-    def make_bank_switch_rt(ptr_table_rom_st: int):
-        # Enter with 8-bit A, 16-bit X/Y
-        effect_switch_rt: assemble.ASMList = [
-            # Replace hook bytes
-            inst.STA(0x20, AM.DIR),
-            inst.CMP(_max_vanilla_routine_index + 1, AM.IMM8),
-            inst.BCS("new_bank"),
-            inst.ASL(mode=AM.NO_ARG),
-            inst.TAX(),
-            inst.JMP(0xC1EB45, AM.LNG),  # Back to vanilla JSR
-            "new_bank",
-            inst.SEC(),
-            inst.SBC(_max_vanilla_routine_index+1, AM.IMM8),
-            inst.ASL(mode=AM.NO_ARG),
-            inst.TAX(),
-            inst.JSR(ptr_table_rom_st & 0xFFFF, AM.ABS_X_16),
-            inst.JMP(0xC1EB48, AM.LNG)  # To vanilla RTS
-        ]
-        return effect_switch_rt
-
-    dummy_rt = make_bank_switch_rt(0)
-    bank_switch_rt_size = len(assemble.assemble(dummy_rt))
-    total_size = sum(effect_rt_lens) + 2 * len(effect_rts) + bank_switch_rt_size
+    ptr_table_size = 2 * len(rt_offsets)
+    total_size = ptr_table_size + len(rt_b) + _bank_switch_rt_size
 
     payload_addr = ct_rom.space_manager.get_free_addr(total_size, 0x410000)
 
     # 4) Write out the new routines
-    real_bank_switch_rt = make_bank_switch_rt(byteops.to_rom_ptr(payload_addr))
+    real_bank_switch_rt = _make_bank_switch_rt(byteops.to_rom_ptr(payload_addr))
     real_bank_switch_rt_b = assemble.assemble(real_bank_switch_rt)
 
-    if additional_effect_routines:
-        first_ptr = (payload_addr + len(additional_effect_routines) * 2) & 0xFFFF
-        rt_b = b''.join(rt for rt in effect_rts)
-        ptrs = [first_ptr]
-        for length in effect_rt_lens[:-1]:
-            ptrs.append(ptrs[-1] + length)
-
-        ptr_b = b''.join(int.to_bytes(ptr, 2, "little")
-                         for ptr in ptrs)
-    else:
-        rt_b = ptr_b = b''
+    first_ptr = (payload_addr + ptr_table_size) & 0xFFFF
+    ptr_b = struct.pack(f"<{len(rt_offsets)}H",
+                        *(first_ptr + offset for offset in rt_offsets))
 
-    payload = ptr_b + rt_b + real_bank_switch_rt_b
+    payload = b''.join((ptr_b, rt_b, real_bank_switch_rt_b))
     if len(payload) != total_size:
         print(len(payload), total_size, len(real_bank_switch_rt_b))
         raise ValueError
 
+    bank_switch_addr = byteops.to_rom_ptr(payload_addr + len(rt_b) + len(ptr_b))
+    hook_b = inst.JMP(bank_switch_addr, AM.LNG).to_bytearray()
 
-    bank_switch_addr = payload_addr + len(rt_b) + len(ptr_b)
-    bank_switch_addr = byteops.to_rom_ptr(bank_switch_addr)
-    hook: assemble.ASMList = [inst.JMP(byteops.to_rom_ptr(bank_switch_addr), AM.LNG)]
-    hook_b = assemble.assemble(hook)
-
-    ct_rom.seek(payload_addr)
-    ct_rom.write(payload, FSWriteType.MARK_USED)
+    ct_rom.write_at(payload_addr, payload, FSWriteType.MARK_USED)
 
-    ct_rom.seek(hook_addr)
-    ct_rom.write(hook_b)
+    ct_rom.write_at(hook_addr, hook_b)
 
     patch_additional_armor_effects(ct_rom, new_eff_start)
     add_independent_sunshades_effect(ct_rom)
@@ -800,25 +936,6 @@ def get_mp_on_hit_rt() -> assemble.ASMList:
     return rt
 
 
-def get_on_crit_rt() -> assemble.ASMList:
-    """
-    Add a routine that gives some effect on a critical hit.
-
-    Notes
-    -----
-    EffectMod is XX YY ZZ (YY, ZZ args)
-    - YY
-    """
-    rt: assemble.ASMList = [
-        inst.LDA(_current_attack_status_offset, AM.ABS),
-        inst.AND(0x80, AM.IMM8),
-        inst.BEQ("end"),
-
-        "end",
-        inst.RTS()
-    ]
-
-
 def get_add_element_effect() -> assemble.ASMList:
     """
     Adds a routine which adds an element to an attack.
@@ -866,8 +983,7 @@ def write_bh_percent(ct_rom: ctrom.CTRom,
 
     bh_percent = pctech.get_black_hole_percent(bh_mp, bh_min, bh_factor)
 
-    ct_rom.seek(0x0C2A72)
-    ct_rom.write(bytes([bh_percent]))
+    ct_rom.write_at(0x0C2A72, bytes([bh_percent]))
 
 
 if __name__ == "__main__":
@@ -138,6 +138,13 @@ class SNESPalette:
     def to_bytes(self):
         return b''.join(x for x in self.colors)
 
+    def copy(self) -> typing.Self:
+        """Return a copy of this palette which shares no color data."""
+        # The colors were validated when self was built, so skip __init__.
+        ret = self.__class__.__new__(self.__class__)
+        ret.colors = [SNESColor(color) for color in self.colors]
+        return ret
+
     def write_to_ctrom(self, ct_rom: ctrom.CTRom, index: int):
         """Write this palette to rom in given index."""
 